@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, NamedTuple, TypeAlias, TypeVar
 from weakref import ReferenceType, finalize
 
@@ -341,11 +341,17 @@ class ComponentRegistry:
         ```
 
         """
+        self._register(name, component)
+
+    def _register(self, name: str, component: type["Component"], tag: str | None = None) -> None:
+        # NOTE: `tag` allows to register the component under a specific tag, instead of the tag
+        #       given by the current tag formatter. This is used by `djc_test` to restore
+        #       the components with the tags they had before the test.
         existing_component = self._registry.get(name)
         if existing_component and existing_component.cls.class_id != component.class_id:
             raise AlreadyRegistered(f'The component "{name}" has already been registered')
 
-        entry = self._register_to_library(name, component)
+        entry = self._register_to_library(name, component, tag)
 
         # Keep track of which components use which tags, because multiple components may
         # use the same tag.
@@ -375,6 +381,40 @@ class ComponentRegistry:
             ),
         )
 
+    def register_many(self, components: Mapping[str, type["Component"]]) -> None:
+        """
+        Register multiple [`Component`](./api.md#django_components.Component) classes
+        with this registry at once.
+
+        All components are validated before any of them is registered. So if one of the names
+        is already taken by a different component, none of the components are registered.
+
+        Args:
+            components (Mapping[str, type[Component]]): Mapping of names to component classes. Required.
+
+        **Raises:**
+
+        - [`AlreadyRegistered`](./exceptions.md#django_components.AlreadyRegistered)
+        if a different component was already registered under any of the given names.
+
+        **Example:**
+
+        ```python
+        registry.register_many({
+            "button": ButtonComponent,
+            "card": CardComponent,
+        })
+        ```
+
+        """
+        for name, component in components.items():
+            existing_component = self._registry.get(name)
+            if existing_component and existing_component.cls.class_id != component.class_id:
+                raise AlreadyRegistered(f'The component "{name}" has already been registered')
+
+        for name, component in components.items():
+            self.register(name, component)
+
     def unregister(self, name: str) -> None:
         """
         Unregister the [`Component`](./api.md#django_components.Component) class
@@ -546,6 +586,7 @@ class ComponentRegistry:
         self,
         comp_name: str,
         component: type["Component"],
+        start_tag: str | None = None,
     ) -> ComponentRegistryEntry:
         # Lazily import to avoid circular dependencies
         from django_components.component import ComponentNode  # noqa: PLC0415
@@ -579,8 +620,9 @@ class ComponentRegistry:
                 end_tag=end_tag,
             )
 
-        formatter = get_tag_formatter(registry)
-        start_tag = formatter.start_tag(comp_name)
+        if start_tag is None:
+            formatter = get_tag_formatter(registry)
+            start_tag = formatter.start_tag(comp_name)
         register_tag(self.library, start_tag, tag_fn)
 
         return ComponentRegistryEntry(cls=component, tag=start_tag)
@@ -33,7 +33,6 @@ See `parse_template()` for details.
 """
 
 import re
-from functools import lru_cache
 
 from django.template.base import DebugLexer, Token, TokenType
 from django.template.exceptions import TemplateSyntaxError
@@ -60,6 +59,10 @@ from django.template.exceptions import TemplateSyntaxError
 #   2. We check them one-by-one, and if we find a broken token, we switch to our parser to fix it.
 #   3. Once the broken token is fixed, we find it's end position, and switch back to the Django lexer
 #      for the remaining text (step 1).
+#
+#   A token with quotes is broken only if Django's lexer ended it inside of a string,
+#   e.g. `{% component key="{% lorem 3 w %}" %}` is cut at the first `%}`.
+#   So if all the strings in the token's contents are terminated, we keep Django's token.
 def parse_template(text: str) -> list[Token]:
     resolved_tokens: list[Token] = []
 
@@ -79,7 +82,11 @@ def parse_template(text: str) -> list[Token]:
             token.lineno += lineno_offset
             token.position = (token.position[0] + index_start, token.position[1] + index_start)
 
-            if token.token_type == TokenType.BLOCK and ("'" in token.contents or '"' in token.contents):
+            if (
+                token.token_type == TokenType.BLOCK
+                and ("'" in token.contents or '"' in token.contents)
+                and not _COMPLETE_TAG_CONTENTS_RE.fullmatch(token.contents)
+            ):
                 broken_token = token
                 break
             resolved_tokens.append(token)
@@ -91,9 +98,12 @@ def parse_template(text: str) -> list[Token]:
 
             resolved_tokens.append(fixed_token)
             index_start = fixed_token.position[1]
-            lineno_offset += (
+            # The next lexer pass starts on the line where the fixed token ended.
+            # NOTE: Count the newlines in the raw text of the token, because the token's contents
+            #       are stripped of the surrounding whitespace.
+            lineno_offset = (
                 fixed_token.lineno - 1  # -1 because lines are 1-indexed
-                + fixed_token.contents.count("\n")
+                + text[broken_token_start : fixed_token.position[1]].count("\n")
             )  # fmt: skip
         else:
             break
@@ -101,124 +111,84 @@ def parse_template(text: str) -> list[Token]:
     return resolved_tokens
 
 
+# Contents of a `{% %}` tag, in which all strings are terminated, and with no `%` outside of strings.
+# For such contents `_detailed_tag_parser()` finds the same end of the tag as Django's lexer,
+# so `parse_template()` doesn't need to fix the token.
+#
+# NOTE: Unlike in `_detailed_tag_parser()`, a backslash inside a string must be followed by another
+#       char, so the pattern doesn't match a string that `_detailed_tag_parser()` would consider
+#       unterminated. When in doubt, the token is passed to `_detailed_tag_parser()`.
+_COMPLETE_TAG_CONTENTS_RE = re.compile(r"""(?:[^'"%]|'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*")*""")
+
+
+# Patterns used by `_detailed_tag_parser()`.
+#
+# Inside of strings, the quote characters are allowed if they are prefixed by a backslash.
+_SINGLE_QUOTED_CONTENT_RE = re.compile(r"(?:\\.|[^'])*")
+_DOUBLE_QUOTED_CONTENT_RE = re.compile(r'(?:\\.|[^"])*')
+_UNTIL_QUOTE_RE = re.compile(r"[^'\"]*")
+_UNTIL_QUOTE_OR_PERCENT_RE = re.compile(r"[^'\"%]*")
+
+
 # Handle parsing of `{% %}` tags, while allowing `%}` inside of strings
+#
+# NOTE: This is the hot loop of the parser, so we walk the text by index and jump
+#       over whole chunks with precompiled regexes, instead of consuming it char by char.
+#
+#       For the intuition, the original char-by-char version of the regex matching is:
+#
+#       ```py
+#       def take_until_any(stop_chars: tuple[str, ...], allow_escapes: bool = False) -> str:
+#           nonlocal index
+#           start = index
+#           while index < length:
+#               char = text[index]
+#               if allow_escapes and char == BACKSLASH and index + 1 < length:
+#                   index += 2
+#                   continue
+#               if char in stop_chars:
+#                   break
+#               index += 1
+#           return text[start:index]
+#       ```
 def _detailed_tag_parser(text: str, lineno: int, start_index: int) -> Token:
-    index = 0
     length = len(text)
-    result_content: list[str] = []
-
-    # Pre-compute common substrings
-    QUOTE_CHARS = ("'", '"')  # noqa: N806
-    QUOTE_OR_PERCENT = (*QUOTE_CHARS, "%")  # noqa: N806
-
-    def take_char() -> str:
-        nonlocal index
-        if index >= length:
-            return ""
-        char = text[index]
-        index += 1
-        return char
-
-    def peek_char(offset: int = 0) -> str:
-        peek_index = index + offset
-        if peek_index >= length:
-            return ""
-        return text[peek_index]
-
-    # This is an optimized version that uses regex to find the next stop character
-    # and ignores the stop characters if they are prefixed by a backslash, if allow_escapes is True.
-    #
-    # For the intuition, the original version is:
-    #
-    # ```py
-    # def take_until_any(stop_chars: tuple[str, ...], allow_escapes: bool = False) -> str:
-    #     nonlocal index
-    #     start = index
-    #     while index < length:
-    #         char = text[index]
-    #         if allow_escapes and char == BACKSLASH and index + 1 < length:
-    #             index += 2
-    #             continue
-    #         if char in stop_chars:
-    #             break
-    #         index += 1
-    #     return text[start:index]
-    # ```
-    def take_until_any(stop_chars: tuple[str, ...], allow_escapes: bool = False) -> str:
-        nonlocal index
-
-        stop_chars_str = "".join(stop_chars)
-        pattern = _compile_take_until_pattern(stop_chars_str, allow_escapes)
-
-        # Find match at current position
-        match = pattern.match(text, index)
-        if match:
-            matched_text = match.group(0)
-            index += len(matched_text)
-            return matched_text
-
-        return ""
 
     # Given that this function is called only when there's a broken token,
     # we know that the first two characters are always "{%"
-    take_char()  # {
-    take_char()  # %
+    index = 2
 
     # Main parsing loop
     while index < length:
-        char = peek_char()
+        char = text[index]
 
         # Handle strings within `{% %}`
-        if char in QUOTE_CHARS:
-            quote_char = take_char()
-            result_content.append(quote_char)
-
+        if char in ("'", '"'):
+            content_re = _SINGLE_QUOTED_CONTENT_RE if char == "'" else _DOUBLE_QUOTED_CONTENT_RE
             # Take content until matching quote, allowing escaped quotes
-            content = take_until_any((quote_char,), allow_escapes=True)
-            result_content.append(content)
+            content_end = content_re.match(text, index + 1).end()  # type: ignore[union-attr]
 
             # Handle the closing quote
-            if peek_char() == quote_char:
-                result_content.append(take_char())
-            else:
-                raise TemplateSyntaxError(f"Unexpected end of text - unterminated {quote_char} string")
+            if content_end >= length or text[content_end] != char:
+                raise TemplateSyntaxError(f"Unexpected end of text - unterminated {char} string")
+            index = content_end + 1
             continue
 
         # Check for closing tag
         if char == "%":
-            if peek_char(1) == "}":
-                take_char()  # %
-                take_char()  # }
+            if index + 1 < length and text[index + 1] == "}":
+                index += 2
                 break
             # False alarm, just a string
-            content = take_until_any(QUOTE_CHARS)
-            result_content.append(content)
+            index = _UNTIL_QUOTE_RE.match(text, index).end()  # type: ignore[union-attr]
             continue
 
         # Take regular content until we hit a quote or potential closing tag
-        content = take_until_any(QUOTE_OR_PERCENT)
-        result_content.append(content)
+        index = _UNTIL_QUOTE_OR_PERCENT_RE.match(text, index).end()  # type: ignore[union-attr]
 
     else:
         raise TemplateSyntaxError("Unexpected end of text - unterminated {% tag")
 
-    result_str = "".join(result_content).strip()  # Django's Lexer.tokenize() strips the whitespace
+    # Everything between `{%` and `%}` is the content of the tag.
+    result_str = text[2 : index - 2].strip()  # Django's Lexer.tokenize() strips the whitespace
     return Token(TokenType.BLOCK, result_str, (start_index, index + start_index), lineno)
-
-
-# Create a regex pattern that takes anything until any of the stop characters are found.
-#
-# If allow_escapes is True, also the stop characters are allowed, given that they are
-# prefixed by a backslash.
-@lru_cache(maxsize=128)
-def _compile_take_until_pattern(stop_chars: str, allow_escapes: bool) -> re.Pattern:
-    escaped_stops = "".join(re.escape(c) for c in stop_chars)
-
-    if allow_escapes:
-        # Match either escaped characters or anything until stop chars
-        pattern = f"(?:\\\\.|[^{escaped_stops}])*"
-    else:
-        # Match anything until stop chars
-        pattern = f"[^{escaped_stops}]*"
-
-    return re.compile(pattern)
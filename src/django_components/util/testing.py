@@ -21,7 +21,7 @@ from django.test import override_settings
 
 from django_components import ComponentsSettings
 from django_components.component import ALL_COMPONENTS, Component, component_node_subclasses_by_name
-from django_components.component_registry import ALL_REGISTRIES, ComponentRegistry
+from django_components.component_registry import ALL_REGISTRIES, ComponentRegistry, ComponentRegistryEntry
 from django_components.extension import extensions
 from django_components.perfutil.provide import provide_cache
 from django_components.template import _reset_component_template_file_cache, loading_components
@@ -30,7 +30,7 @@ if TYPE_CHECKING:
     from django_components.component_media import ComponentMedia
 
 RegistryRef: TypeAlias = ReferenceType[ComponentRegistry]
-RegistriesCopies: TypeAlias = list[tuple[ReferenceType[ComponentRegistry], list[str]]]
+RegistriesCopies: TypeAlias = list[tuple[ReferenceType[ComponentRegistry], dict[str, ComponentRegistryEntry]]]
 InitialComponents: TypeAlias = list[ReferenceType[type[Component]]]
 
 
@@ -331,7 +331,7 @@ def djc_test(
                     reg = reg_ref()
                     if not reg:
                         continue
-                    _all_registries_copies.append((reg_ref, list(reg._registry.keys())))
+                    _all_registries_copies.append((reg_ref, dict(reg._registry)))
 
                 # Prepare global state
                 _setup_djc_global_state(gen_id_patcher, csrf_token_patcher)
@@ -515,30 +515,33 @@ def _clear_djc_global_state(
             del ALL_COMPONENTS[reverse_index]
 
     # Remove registries that were created during the test
-    initial_registries_set: set[RegistryRef] = {reg_ref for reg_ref, _init_keys in initial_registries_copies}
+    initial_registries_set: set[RegistryRef] = {reg_ref for reg_ref, _init_comps in initial_registries_copies}
     for index in range(len(ALL_REGISTRIES)):
         registry_ref = ALL_REGISTRIES[len(ALL_REGISTRIES) - index - 1]
         is_ref_deleted = registry_ref() is None
         if is_ref_deleted or registry_ref not in initial_registries_set:
             del ALL_REGISTRIES[len(ALL_REGISTRIES) - index - 1]
 
-    # For the remaining registries, unregistr components that were registered
-    # during tests.
-    # NOTE: The approach below does NOT take into account:
-    # - If a component was UNregistered during the test
-    # - If a previously-registered component was overwritten with different registration.
-    for reg_ref, init_keys in initial_registries_copies:
+    # For the remaining registries, restore the components to the state from before the test.
+    # This handles components that were registered, unregistered (e.g. with `registry.clear()`),
+    # or overwritten during the test.
+    for reg_ref, init_comps in initial_registries_copies:
         registry_original = reg_ref()
         if not registry_original:
             continue
 
-        # Get the keys that were registered during the test
-        initial_registered_keys = set(init_keys)
-        after_test_registered_keys = set(registry_original._registry.keys())
-        keys_registered_during_test = after_test_registered_keys - initial_registered_keys
-        # Remove them
-        for key in keys_registered_during_test:
-            registry_original.unregister(key)
+        # Remove components that were registered during the test,
+        # or that were registered under a name that previously held a different component or tag.
+        for name, entry in list(registry_original._registry.items()):
+            if init_comps.get(name) != entry:
+                registry_original.unregister(name)
+
+        # Re-register components that were removed or overwritten during the test.
+        # NOTE: The test's settings (e.g. `tag_formatter`) are still active at this point,
+        #       so we register the components with their original tags.
+        for name, entry in init_comps.items():
+            if not registry_original.has(name):
+                registry_original._register(name, entry.cls, tag=entry.tag)
 
     # Delete autoimported modules from memory, so the module
     # is executed also the next time one of the tests calls `autodiscover`.
@@ -97,6 +97,31 @@ class TestComponentRegistry:
             "testcomponent2": MockComponent,
         }
 
+    def test_register_many(self):
+        custom_registry = ComponentRegistry()
+        custom_registry.register_many(
+            {
+                "testcomponent": MockComponent,
+                "testcomponent2": MockComponent2,
+            },
+        )
+        assert custom_registry.all() == {
+            "testcomponent": MockComponent,
+            "testcomponent2": MockComponent2,
+        }
+
+    def test_register_many_registers_nothing_on_conflict(self):
+        custom_registry = ComponentRegistry()
+        custom_registry.register(name="testcomponent", component=MockComponent)
+        with pytest.raises(AlreadyRegistered):
+            custom_registry.register_many(
+                {
+                    "testcomponent2": MockComponent,
+                    "testcomponent": MockComponent2,
+                },
+            )
+        assert custom_registry.all() == {"testcomponent": MockComponent}
+
     def test_unregisters_only_unused_tags(self):
         custom_library = Library()
         custom_registry = ComponentRegistry(library=custom_library)
@@ -171,6 +196,46 @@ class TestComponentRegistry:
         with pytest.raises(NotRegistered):
             custom_registry.unregister(name="testcomponent")
 
+    def test_djc_test_restores_cleared_registry(self):
+        initial_components = registry.all()
+        assert initial_components
+
+        @djc_test
+        def inner_test():
+            registry.clear()
+            registry.register(name="testcomponent", component=MockComponent)
+            assert registry.all() == {"testcomponent": MockComponent}
+
+        inner_test()
+
+        assert registry.all() == initial_components
+
+    def test_djc_test_restores_cleared_registry_with_original_tags(self):
+        initial_components = registry.all()
+        assert initial_components
+        assert "component" in registry.library.tags
+
+        @djc_test(
+            components_settings={
+                "tag_formatter": "django_components.component_shorthand_formatter",
+            },
+        )
+        def inner_test():
+            registry.clear()
+            registry.register(name="testcomponent", component=MockComponent)
+            assert "testcomponent" in registry.library.tags
+
+        inner_test()
+
+        assert registry.all() == initial_components
+        assert "component" in registry.library.tags
+        assert "testcomponent" not in registry.library.tags
+        for name in initial_components:
+            assert name not in registry.library.tags
+
+        template = Template('{% component "dynamic" is="testcomponent" / %}')
+        assert template.nodelist
+
 
 @djc_test
 class TestMultipleComponentRegistries:
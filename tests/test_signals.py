@@ -1,49 +1,56 @@
-from functools import wraps
+import threading
+from unittest.mock import patch
 
 from django.template import Context, Template
+from django.test.signals import template_rendered
+from django.test.utils import instrumented_test_render
 
 from django_components import Component, registry, types
 from django_components.testing import djc_test
 
-from .testutils import PARAMETRIZE_CONTEXT_BEHAVIOR, setup_test_config
+from .testutils import PARAMETRIZE_CONTEXT_BEHAVIOR, compile_template, setup_test_config
 
 setup_test_config()
 
+# `Template._render` is a class attribute, so patching it affects all threads.
+# The patched method instruments only the renders of the thread that set the flag,
+# other threads fall through to the original method.
+_original_template_render = Template._render
+_instrumentation = threading.local()
 
-def _get_templates_used_to_render(subject_template, render_context=None):
-    """Emulate django.test.client.Client (see request method)."""
-    from django.test.signals import template_rendered
 
-    templates_used = []
-
-    def receive_template_signal(sender, template, context, **_kwargs):  # noqa: ARG001
-        templates_used.append(template.name)
-
-    template_rendered.connect(receive_template_signal, dispatch_uid="test_method")
-    subject_template.render(render_context or Context({}))
-    template_rendered.disconnect(dispatch_uid="test_method")
-    return templates_used
-
-
-def with_template_signal(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        # Emulate Django test instrumentation for TestCase (see setup_test_environment)
-        from django.template import Template
-        from django.test.utils import instrumented_test_render
-
-        original_template_render = Template._render
-        Template._render = instrumented_test_render
-
-        func(*args, **kwargs)
-
-        Template._render = original_template_render
-
-    return wrapper
+def _maybe_instrumented_test_render(self, context):
+    if getattr(_instrumentation, "active", False):
+        return instrumented_test_render(self, context)
+    return _original_template_render(self, context)
 
 
 @djc_test
 class TestTemplateSignal:
+    # Emulate django.test.client.Client (see request method).
+    # The receiver is connected once per test, instead of on each render.
+    def setup_method(self):
+        self.templates_used: list[str] = []
+        template_rendered.connect(self._receive_template_signal, weak=False, dispatch_uid="test_method")
+
+    def teardown_method(self):
+        template_rendered.disconnect(dispatch_uid="test_method")
+
+    def _receive_template_signal(self, sender, template, context, **_kwargs):
+        self.templates_used.append(template.name)
+
+    def templates_used_to_render(self, subject_template, render_context=None):
+        self.templates_used.clear()
+        # Emulate Django test instrumentation for TestCase (see setup_test_environment),
+        # but only for the duration of this render, so other tests use the original `Template._render`.
+        with patch.object(Template, "_render", _maybe_instrumented_test_render):
+            _instrumentation.active = True
+            try:
+                subject_template.render(render_context or Context({}))
+            finally:
+                _instrumentation.active = False
+        return list(self.templates_used)
+
     def gen_slotted_component(self):
         class SlottedComponent(Component):
             template_file = "slotted_template.html"
@@ -67,38 +74,41 @@ class TestTemplateSignal:
         return InnerComponent
 
     @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
-    @with_template_signal
     def test_template_rendered(self, components_settings):
-        registry.register("test_component", self.gen_slotted_component())
-        registry.register("inner_component", self.gen_inner_component())
+        registry.register_many(
+            {
+                "test_component": self.gen_slotted_component(),
+                "inner_component": self.gen_inner_component(),
+            },
+        )
         template_str: types.django_html = """
-            {% load component_tags %}
             {% component 'test_component' %}{% endcomponent %}
         """
-        template = Template(template_str, name="root")
-        templates_used = _get_templates_used_to_render(template)
+        template = compile_template(template_str, name="root")
+        templates_used = self.templates_used_to_render(template)
         assert "slotted_template.html" in templates_used
 
     @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
-    @with_template_signal
     def test_template_rendered_nested_components(self, components_settings):
-        registry.register("test_component", self.gen_slotted_component())
-        registry.register("inner_component", self.gen_inner_component())
+        registry.register_many(
+            {
+                "test_component": self.gen_slotted_component(),
+                "inner_component": self.gen_inner_component(),
+            },
+        )
         template_str: types.django_html = """
-            {% load component_tags %}
             {% component 'test_component' %}
               {% fill "header" %}
                 {% component 'inner_component' variable='foo' %}{% endcomponent %}
               {% endfill %}
             {% endcomponent %}
         """
-        template = Template(template_str, name="root")
-        templates_used = _get_templates_used_to_render(template)
+        template = compile_template(template_str, name="root")
+        templates_used = self.templates_used_to_render(template)
         assert "slotted_template.html" in templates_used
         assert "simple_template.html" in templates_used
 
     @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
-    @with_template_signal
     def test_template_rendered_skipped_when_no_template(self, components_settings):
         class EmptyComponent(Component):
             pass
@@ -106,9 +116,8 @@ class TestTemplateSignal:
         registry.register("empty", EmptyComponent)
 
         template_str: types.django_html = """
-            {% load component_tags %}
             {% component 'empty' / %}
         """
-        template = Template(template_str, name="root")
-        templates_used = _get_templates_used_to_render(template)
+        template = compile_template(template_str, name="root")
+        templates_used = self.templates_used_to_render(template)
         assert templates_used == ["root"]
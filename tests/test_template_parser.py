@@ -1,5 +1,7 @@
+import pytest
 from django.template import Context
 from django.template.base import Template, Token, TokenType
+from django.template.exceptions import TemplateSyntaxError
 from pytest_django.asserts import assertHTMLEqual
 
 from django_components import Component, register, types
@@ -167,6 +169,47 @@ class TestTemplateParser:
 
         assert token_tuples == expected_tokens
 
+    def test_multiline_tag_with_quotes(self):
+        tokens = parse_template("{% component 'test'\n%}{{ name }}")
+
+        token_tuples = [token2tuple(token) for token in tokens]
+        expected_tokens = [
+            (TokenType.BLOCK, "component 'test'", (0, 22), 1),
+            (TokenType.VAR, "name", (22, 32), 2),
+        ]
+
+        assert token_tuples == expected_tokens
+
+    def test_lineno_after_multiple_nested_tags(self):
+        tokens = parse_template('a\n{% c x="{% l %}" %}\nb\n{% c x="{% l\n%}" %}\nc\n{{ v }}')
+
+        token_tuples = [token2tuple(token) for token in tokens]
+        expected_tokens = [
+            (TokenType.TEXT, "a\n", (0, 2), 1),
+            (TokenType.BLOCK, 'c x="{% l %}"', (2, 21), 2),
+            (TokenType.TEXT, "\nb\n", (21, 24), 2),
+            (TokenType.BLOCK, 'c x="{% l\n%}"', (24, 43), 4),
+            (TokenType.TEXT, "\nc\n", (43, 46), 5),
+            (TokenType.VAR, "v", (46, 53), 7),
+        ]
+
+        assert token_tuples == expected_tokens
+
+    def test_escaped_quotes_in_nested_tags(self):
+        tokens = parse_template(r"""{% component 'test' var="{% lorem \"a %} w %}" %}after""")
+
+        token_tuples = [token2tuple(token) for token in tokens]
+        expected_tokens = [
+            (TokenType.BLOCK, 'component \'test\' var="{% lorem \\"a %} w %}"', (0, 49), 1),
+            (TokenType.TEXT, "after", (49, 54), 1),
+        ]
+
+        assert token_tuples == expected_tokens
+
+    def test_unterminated_string_in_nested_tags(self):
+        with pytest.raises(TemplateSyntaxError, match='unterminated " string'):
+            parse_template("""{% component 'test' var="{% lorem %} %}""")
+
     def test_template_mixed(self):
         tokens = parse_template(
             """Hello {{ name }}
@@ -3,45 +3,60 @@
 from django.template import Context, Template
 from pytest_django.asserts import assertHTMLEqual
 
-from django_components import Component, register, registry, types
+from django_components import Component, registry, types
 from django_components.testing import djc_test
 
-from .testutils import PARAMETRIZE_CONTEXT_BEHAVIOR, setup_test_config
+from .testutils import setup_test_config, trim_template
 
 setup_test_config()
 
+# The tests below render with an empty context and don't modify it.
+# `Template.render()` pushes and pops its own layers on the Context and its RenderContext,
+# so a single instance can be shared instead of creating a new Context for each render.
+_EMPTY_CONTEXT = Context()
+
 
 #######################
 # TESTS
 #######################
 
+# NOTE: The tests in this file check how the template tags are parsed. Parsing does not depend
+#       on `context_behavior`, so unlike most other tests, these are not parametrized with
+#       `PARAMETRIZE_CONTEXT_BEHAVIOR`, and run only once with the default settings.
+#
+# NOTE: `setup_test_config()` sets `component_tags` as a builtin library of the template engine,
+#       so the templates below don't need `{% load component_tags %}`.
+
 
 @djc_test
 class TestMultilineTags:
-    @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
-    def test_multiline_tags(self, components_settings):
-        @register("test_component")
-        class SimpleComponent(Component):
-            template: types.django_html = """
-                Variable: <strong>{{ variable }}</strong>
+    class SimpleComponent(Component):
+        template: types.django_html = trim_template(
             """
+            Variable: <strong>{{ variable }}</strong>
+            """,
+        )
 
-            def get_template_data(self, args, kwargs, slots, context):
-                return {
-                    "variable": kwargs["variable"],
-                    "variable2": kwargs.get("variable2", "default"),
-                }
+        def get_template_data(self, args, kwargs, slots, context):
+            return {
+                "variable": kwargs["variable"],
+                "variable2": kwargs.get("variable2", "default"),
+            }
+
+    def test_multiline_tags(self):
+        registry.register("test_component", self.SimpleComponent)
 
-        template: types.django_html = """
-            {% load component_tags %}
+        template_str: types.django_html = trim_template(
+            """
             {% component
                 "test_component"
                 variable=123
                 variable2="abc"
             %}
             {% endcomponent %}
-        """
-        rendered = Template(template).render(Context())
+            """,
+        )
+        rendered = Template(template_str).render(_EMPTY_CONTEXT)
         expected = """
             Variable: <strong data-djc-id-ca1bc3f>123</strong>
         """
@@ -51,9 +66,11 @@ class TestMultilineTags:
 @djc_test
 class TestNestedTags:
     class SimpleComponent(Component):
-        template: types.django_html = """
+        template: types.django_html = trim_template(
+            """
             Variable: <strong>{{ var }}</strong>
-        """
+            """,
+        )
 
         def get_template_data(self, args, kwargs, slots, context):
             return {
@@ -61,72 +78,47 @@ class TestNestedTags:
             }
 
     # See https://github.com/django-components/django-components/discussions/671
-    @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
-    def test_nested_tags(self, components_settings):
+    def test_nested_tags(self):
         registry.register("test", self.SimpleComponent)
 
-        template: types.django_html = """
-            {% load component_tags %}
-            {% component "test" var="{% lorem 1 w %}" %}{% endcomponent %}
-        """
-        rendered = Template(template).render(Context())
+        template_str: types.django_html = """{% component "test" var="{% lorem 1 w %}" %}{% endcomponent %}"""
+        rendered = Template(template_str).render(_EMPTY_CONTEXT)
         expected = """
             Variable: <strong data-djc-id-ca1bc3f>lorem</strong>
         """
         assertHTMLEqual(rendered, expected)
 
-    @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
-    def test_nested_quote_single(self, components_settings):
+    # The quotes inside the tag inputs are what's under test, so each case needs its own
+    # template source, instead of sharing one template and varying the context.
+    @djc_test(
+        parametrize=(
+            ["template_str", "expected_var"],
+            [
+                [
+                    """{% component "test" var=_("organisation's") %} {% endcomponent %}""",
+                    "organisation&#x27;s",
+                ],
+                [
+                    """{% component "test" var=_("organisation's") / %}""",
+                    "organisation&#x27;s",
+                ],
+                [
+                    """{% component "test" var=_('organisation"s') %} {% endcomponent %}""",
+                    'organisation"s',
+                ],
+                [
+                    """{% component "test" var=_('organisation"s') / %}""",
+                    'organisation"s',
+                ],
+            ],
+            ["single", "single_self_closing", "double", "double_self_closing"],
+        ),
+    )
+    def test_nested_quotes(self, template_str, expected_var):
         registry.register("test", self.SimpleComponent)
 
-        template: types.django_html = """
-            {% load component_tags %}
-            {% component "test" var=_("organisation's") %} {% endcomponent %}
-        """
-        rendered = Template(template).render(Context())
-        expected = """
-            Variable: <strong data-djc-id-ca1bc3f>organisation&#x27;s</strong>
-        """
-        assertHTMLEqual(rendered, expected)
-
-    @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
-    def test_nested_quote_single_self_closing(self, components_settings):
-        registry.register("test", self.SimpleComponent)
-
-        template: types.django_html = """
-            {% load component_tags %}
-            {% component "test" var=_("organisation's") / %}
-        """
-        rendered = Template(template).render(Context())
-        expected = """
-            Variable: <strong data-djc-id-ca1bc3f>organisation&#x27;s</strong>
-        """
-        assertHTMLEqual(rendered, expected)
-
-    @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
-    def test_nested_quote_double(self, components_settings):
-        registry.register("test", self.SimpleComponent)
-
-        template: types.django_html = """
-            {% load component_tags %}
-            {% component "test" var=_('organisation"s') %} {% endcomponent %}
-        """
-        rendered = Template(template).render(Context())
-        expected = """
-            Variable: <strong data-djc-id-ca1bc3f>organisation"s</strong>
-        """
-        assertHTMLEqual(rendered, expected)
-
-    @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
-    def test_nested_quote_double_self_closing(self, components_settings):
-        registry.register("test", self.SimpleComponent)
-
-        template: types.django_html = """
-            {% load component_tags %}
-            {% component "test" var=_('organisation"s') / %}
-        """
-        rendered = Template(template).render(Context())
-        expected = """
-            Variable: <strong data-djc-id-ca1bc3f>organisation"s</strong>
+        rendered = Template(template_str).render(_EMPTY_CONTEXT)
+        expected = f"""
+            Variable: <strong data-djc-id-ca1bc3f>{expected_var}</strong>
         """
         assertHTMLEqual(rendered, expected)
@@ -26,7 +26,6 @@ class TestNestedSlot:
 
     @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
     def test_default_slot_contents_render_correctly(self, components_settings):
-        registry.clear()
         registry.register("test", self._get_nested_component())
         template_str: types.django_html = """
             {% load component_tags %}
@@ -38,7 +37,6 @@ class TestNestedSlot:
 
     @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
     def test_inner_slot_overriden(self, components_settings):
-        registry.clear()
         registry.register("test", self._get_nested_component())
         template_str: types.django_html = """
             {% load component_tags %}
@@ -52,7 +50,6 @@ class TestNestedSlot:
 
     @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
     def test_outer_slot_overriden(self, components_settings):
-        registry.clear()
         registry.register("test", self._get_nested_component())
         template_str: types.django_html = """
             {% load component_tags %}
@@ -64,7 +61,6 @@ class TestNestedSlot:
 
     @djc_test(parametrize=PARAMETRIZE_CONTEXT_BEHAVIOR)
     def test_both_overriden_and_inner_removed(self, components_settings):
-        registry.clear()
         registry.register("test", self._get_nested_component())
         template_str: types.django_html = """
             {% load component_tags %}
@@ -106,7 +102,6 @@ class TestNestedSlot:
                     "name": kwargs.get("name", None),
                 }
 
-        registry.clear()
         registry.register("test", SlottedComponent)
 
         template_str: types.django_html = """
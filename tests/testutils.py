@@ -1,7 +1,16 @@
+import textwrap
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 
 import django
 from django.conf import settings
+from django.template import Engine, Template
+from django.test.html import Element, parse_html
+from pytest_django.asserts import assertHTMLEqual
+
+from django_components import registry
+from django_components.util import misc
 
 # Common use case in our tests is to check that the component works in both
 # "django" and "isolated" context behaviors. If you need only that, pass this
@@ -16,6 +25,93 @@ PARAMETRIZE_CONTEXT_BEHAVIOR = (
 )
 
 
+# Parametrized tests (e.g. with `PARAMETRIZE_CONTEXT_BEHAVIOR`) render the same template
+# source several times. Compiling the source is independent of the parametrized settings,
+# so we compile it only once and reuse the Template instance.
+#
+# NOTE: Treat the returned Template as immutable - only call `render()` on it.
+#
+# NOTE: The cache is shared by the whole test session. So that a cached Template is returned
+#       only where a fresh compile would give the same result, the cache is keyed also by:
+#       - The django-components settings, except `context_behavior`, which is used only when rendering.
+#         So a test with e.g. a different `tag_formatter` compiles the template again.
+#       - The default template engine, and the template tags of the default registry's library.
+#         So if e.g. the `component` tag is missing, the compilation fails as it would without the cache.
+#       Other changes that affect parsing (e.g. the settings of custom registries) are not covered,
+#       so tests with such parametrizations should compile with `Template()` instead.
+#
+# NOTE: Component tags are assigned IDs when the template is compiled. So that the rendered
+#       IDs are the same whether the template was compiled or taken from the cache, we record
+#       how many IDs the compilation used up, and on a cache hit we generate the same number of IDs.
+#       The cache is keyed also by the number of IDs generated so far in the test,
+#       so a cached Template holds the same node IDs as a freshly compiled one would.
+#       The IDs can be counted only inside `djc_test`, which replaces the ID generator with a mock.
+#       Outside of `djc_test`, the template is compiled without the cache.
+_compiled_templates: dict[tuple[str, str | None, str, int, tuple[str, ...], int], tuple[Template, int]] = {}
+
+
+def _get_gen_id_count() -> int | None:
+    # Inside `djc_test`, the ID generator is a mock, so we can read how many times it was called.
+    return getattr(misc.generate, "call_count", None)
+
+
+def _get_parse_settings_key() -> str:
+    components_settings = getattr(settings, "COMPONENTS", {})
+    if not isinstance(components_settings, Mapping):
+        components_settings = components_settings._asdict()  # `ComponentsSettings` NamedTuple
+    return repr(sorted((key, value) for key, value in components_settings.items() if key != "context_behavior"))
+
+
+def compile_template(template_str: str, name: str | None = None) -> Template:
+    id_count_before = _get_gen_id_count()
+    if id_count_before is None:
+        return Template(template_str, name=name)
+
+    cache_key = (
+        template_str,
+        name,
+        _get_parse_settings_key(),
+        id(Engine.get_default()),
+        tuple(sorted(registry.library.tags)),
+        id_count_before,
+    )
+
+    if cache_key in _compiled_templates:
+        template, id_count = _compiled_templates[cache_key]
+        for _ in range(id_count):
+            misc.gen_id()
+        return template
+
+    template = Template(template_str, name=name)
+    id_count = misc.generate.call_count - id_count_before  # type: ignore[attr-defined]
+    _compiled_templates[cache_key] = (template, id_count)
+    return template
+
+
+def trim_template(template_str: str) -> str:
+    """
+    Remove the indentation and the surrounding whitespace of a template literal.
+
+    The whitespace would otherwise end up in the TextNodes of the compiled template,
+    and would be copied into the output on each render.
+    """
+    return textwrap.dedent(template_str).strip()
+
+
+# The expected HTML of a test is a constant, but with parametrized tests it is compared
+# against the rendered output several times. So we parse it only once.
+@lru_cache(maxsize=256)
+def _parse_expected_html(expected: str) -> Element:
+    return parse_html(expected)
+
+
+def assert_html_equal_cached(rendered: str, expected: str) -> None:
+    """Same as `assertHTMLEqual()`, but parses the `expected` HTML only once."""
+    if parse_html(rendered) != _parse_expected_html(expected):
+        # Let `assertHTMLEqual()` format the error message with the diff
+        assertHTMLEqual(rendered, expected)
+
+
 def setup_test_config(
     components: dict | None = None,
     extra_settings: dict | None = None,
@@ -37,13 +133,20 @@ def setup_test_config(
                     "builtins": [
                         "django_components.templatetags.component_tags",
                     ],
+                    # Cache the loaded templates, so the tests don't read the template files
+                    # from disk on each render. `djc_test` resets the cache after each test.
                     "loaders": [
-                        # Default Django loader
-                        "django.template.loaders.filesystem.Loader",
-                        # Including this is the same as APP_DIRS=True
-                        "django.template.loaders.app_directories.Loader",
-                        # Components loader
-                        "django_components.template_loader.Loader",
+                        (
+                            "django.template.loaders.cached.Loader",
+                            [
+                                # Default Django loader
+                                "django.template.loaders.filesystem.Loader",
+                                # Including this is the same as APP_DIRS=True
+                                "django.template.loaders.app_directories.Loader",
+                                # Components loader
+                                "django_components.template_loader.Loader",
+                            ],
+                        ),
                     ],
                 },
             },